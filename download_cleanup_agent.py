@@ -5,24 +5,137 @@ Scans the Downloads folder and uses GPT-4o-mini to suggest files for deletion.
 """
 
 import os
+import io
+import csv
+import sys
 import json
+import math
+import fcntl
+import functools
+import hashlib
+import textwrap
+import asyncio
+import argparse
+import tempfile
 import subprocess
+from itertools import islice
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from datetime import datetime
-from typing import List, Dict, Any
-from openai import OpenAI
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+import numpy as np
+from openai import AsyncOpenAI, APIConnectionError, APIStatusError, InternalServerError, RateLimitError
 from dotenv import load_dotenv
 import questionary
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the standard library
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # Optional; without it suggestions are shown once the response is complete
+    ijson = None
+
 # Load environment variables
 load_dotenv()
 
-# Path to the kept files database
-KEPT_FILES_DB = Path(__file__).parent / "kept_files.json"
+# Path to the kept files database (one JSON entry per line, append-only)
+KEPT_FILES_DB = Path(__file__).parent / "kept_files.jsonl"
+
+# Path to the kept files database written by earlier versions, still read on load
+LEGACY_KEPT_FILES_DB = KEPT_FILES_DB.with_suffix(".json")
+
+# Path to the state file tracking a submitted Batch API job
+BATCH_STATE_FILE = KEPT_FILES_DB.parent / "pending_batch.json"
+
+# Signature of the files analyzed in the last run, used to skip unchanged folders
+SCAN_SIGNATURE_FILE = KEPT_FILES_DB.parent / ".scan_sig.json"
+
+# Suggestions are saved under this name in the Downloads folder
+SUGGESTIONS_FILENAME = "cleanup_suggestions.json"
+
+# Saved suggestions older than this are not reused, even for an unchanged folder
+SUGGESTIONS_MAX_AGE_HOURS = 24
+
+# Batch API statuses that mean the job is still being worked on
+BATCH_PENDING_STATUSES = {"validating", "in_progress", "finalizing", "cancelling"}
+
+# Finished Batch API statuses that may carry (possibly partial) output
+BATCH_COLLECTABLE_STATUSES = {"completed", "expired", "cancelled"}
+
+# Number of files sent per labeled batch within a prompt
+FILES_PER_BATCH = 50
+
+# Maximum labeled batches per request; accuracy degrades beyond this
+MAX_BATCHES_PER_REQUEST = 15
+
+# Maximum number of chat completion requests in flight at once
+MAX_CONCURRENT_REQUESTS = 8
+
+# Number of times a rate-limited or transiently failing chat request is retried
+MAX_RATE_LIMIT_RETRIES = 5
+
+# Upper bound on a server-requested retry delay
+MAX_RETRY_AFTER_SECONDS = 300
+
+# Maximum number of files deleted in parallel
+MAX_DELETE_WORKERS = 16
+
+# Emoji shown for each confidence level
+_EMOJI = {"high": "🔴", "medium": "🟡", "low": "🟢"}
 
+# Responses are deterministic, so they are cached on disk keyed by the request.
+# Entries expire after a day so stale answers aren't replayed forever; delete
+# this directory to invalidate the cache sooner.
+RESPONSE_CACHE_DIR = Path.home() / ".cache" / "dlcleanup"
+# Same limit as saved suggestions, so the response cache can't outlive them
+RESPONSE_CACHE_MAX_AGE_HOURS = SUGGESTIONS_MAX_AGE_HOURS
+RESPONSE_CACHE_MAX_ENTRIES = 256
 
+
+def env_float(name: str, default: float) -> float:
+    """Read a non-negative float from the environment, falling back to `default` on a bad value."""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        number = float(value)
+    except ValueError:
+        number = -1.0
+    if not math.isfinite(number) or number < 0:
+        print(f"Warning: Ignoring invalid {name}={value!r}, using {default}")
+        return default
+    return number
+
+
+# Recent, small documents of these types are kept without asking the model
+SAFE_EXTENSIONS = {".pdf", ".docx", ".xlsx"}
+AUTO_KEEP_MAX_AGE_DAYS = env_float("CLEANUP_MIN_AGE_DAYS", 7)
+AUTO_KEEP_MAX_SIZE_MB = env_float("CLEANUP_MIN_SIZE_MB", 1)
+
+
+def json_loads(data: Any) -> Any:
+    """Parse JSON from a str or bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize to a JSON string, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    return json.dumps(obj, indent=2 if indent else None)
+
+
+@functools.lru_cache(maxsize=1)
 def get_downloads_folder() -> Path:
-    """Get the Downloads folder path for macOS."""
+    """Get the Downloads folder path for macOS (resolved once per process)."""
     home = Path.home()
     downloads = home / "Downloads"
     if not downloads.exists():
@@ -30,57 +143,110 @@ def get_downloads_folder() -> Path:
     return downloads
 
 
-def scan_downloads_folder(downloads_path: Path) -> List[Dict[str, Any]]:
-    """Scan the Downloads folder and collect file metadata."""
-    files = []
+@dataclass
+class FileTable:
+    """Metadata for the items in a folder, stored as parallel arrays (one entry per item)."""
+    names: List[str]
+    extensions: np.ndarray  # lowercase suffix including the dot, "" when there is none
+    sizes: np.ndarray       # int64, bytes
+    mtimes: np.ndarray      # int64, modification time in ns since the epoch
+    is_dir: np.ndarray      # bool
     
-    for item in downloads_path.iterdir():
-        try:
-            stat = item.stat()
-            file_info = {
-                "name": item.name,
-                "path": str(item),
-                "size_bytes": stat.st_size,
-                "size_mb": round(stat.st_size / (1024 * 1024), 2),
-                "extension": item.suffix.lower(),
-                "modified_date": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                "is_file": item.is_file(),
-                "is_dir": item.is_dir(),
-            }
-            files.append(file_info)
-        except (OSError, PermissionError) as e:
-            print(f"Warning: Could not access {item.name}: {e}")
-            continue
+    def __len__(self) -> int:
+        return len(self.names)
+    
+    def __getitem__(self, index: np.ndarray) -> "FileTable":
+        """Select rows by boolean mask or integer index array."""
+        if index.dtype == bool:
+            index = np.flatnonzero(index)
+        return FileTable(
+            names=[self.names[i] for i in index],
+            extensions=self.extensions[index],
+            sizes=self.sizes[index],
+            mtimes=self.mtimes[index],
+            is_dir=self.is_dir[index],
+        )
     
-    return files
+    def total_size_mb(self) -> float:
+        return float(self.sizes.sum()) / (1024 * 1024)
+    
+    def prompt_order(self) -> np.ndarray:
+        """Row order by size (largest first) and then by date (oldest first)."""
+        return np.lexsort((self.mtimes, -self.sizes))
 
 
-def format_files_for_prompt(files: List[Dict[str, Any]]) -> str:
-    """Format file list for the AI prompt."""
-    # Sort by size (largest first) and then by date (oldest first)
-    sorted_files = sorted(files, key=lambda x: (-x["size_bytes"], x["modified_date"]))
+def scan_downloads_folder(downloads_path: Path) -> FileTable:
+    """Scan the Downloads folder and collect file metadata."""
+    names = []
+    extensions = []
+    sizes = []
+    mtimes = []
+    is_dir = []
     
-    formatted = []
-    for f in sorted_files:
-        item_type = "📁 Folder" if f["is_dir"] else "📄 File"
-        formatted.append(
-            f"{item_type}: {f['name']} | "
-            f"Size: {f['size_mb']} MB | "
-            f"Modified: {f['modified_date'][:10]} | "
-            f"Extension: {f['extension'] or 'none'}"
-        )
+    # DirEntry caches the type from the directory listing, so each item
+    # costs a single stat() call
+    with os.scandir(downloads_path) as entries:
+        for entry in entries:
+            try:
+                stat = entry.stat(follow_symlinks=False)
+                directory = entry.is_dir(follow_symlinks=False)
+            except (OSError, PermissionError) as e:
+                print(f"Warning: Could not access {entry.name}: {e}")
+                continue
+            
+            stem, dot, suffix = entry.name.rpartition(".")
+            names.append(entry.name)
+            extensions.append(f".{suffix.lower()}" if dot and stem and suffix else "")
+            sizes.append(stat.st_size)
+            mtimes.append(stat.st_mtime_ns)
+            is_dir.append(directory)
     
-    return "\n".join(formatted)
+    return FileTable(
+        names=names,
+        extensions=np.array(extensions, dtype=str),
+        sizes=np.array(sizes, dtype=np.int64),
+        mtimes=np.array(mtimes, dtype=np.int64),
+        is_dir=np.array(is_dir, dtype=bool),
+    )
 
 
-def get_deletion_suggestions(files: List[Dict[str, Any]], client: OpenAI) -> Dict[str, Any]:
-    """Get deletion suggestions from GPT-4o-mini."""
+def format_files_for_prompt(files: FileTable) -> str:
+    """Format file list for the AI prompt as compact CSV."""
+    sizes_mb = np.round(files.sizes / (1024 * 1024), 2)
     
-    file_list_text = format_files_for_prompt(files)
-    total_size_mb = sum(f["size_mb"] for f in files)
-    file_count = len(files)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(["name", "type", "size_mb", "modified", "ext"])
+    writer.writerows(
+        (
+            files.names[i],
+            "d" if files.is_dir[i] else "f",
+            float(sizes_mb[i]),
+            datetime.fromtimestamp(files.mtimes[i] / 1e9).strftime("%Y-%m-%d"),
+            files.extensions[i],
+        )
+        for i in files.prompt_order()
+    )
     
-    system_prompt = """You are a helpful assistant that analyzes files in a Downloads folder and suggests which ones can be safely deleted.
+    return buffer.getvalue().rstrip("\n")
+
+
+def chunk_files(items: List[Any], size: int) -> List[List[Any]]:
+    """Split a list into consecutive chunks of at most `size` items."""
+    iterator = iter(items)
+    chunks = []
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return chunks
+        chunks.append(chunk)
+
+
+# Stable end-user id so repeated requests are routed to the same prompt cache
+PROMPT_CACHE_USER = "downloads-cleanup"
+
+# Kept byte-identical across calls (nothing dynamic) so OpenAI prompt caching can reuse it
+SYSTEM_PROMPT = """You are a helpful assistant that analyzes files in a Downloads folder and suggests which ones can be safely deleted.
 
 Consider these factors when making suggestions:
 1. **File age**: Old files (6+ months) are often safe to delete unless they're important documents
@@ -93,28 +259,46 @@ Consider these factors when making suggestions:
 4. **Common patterns**: Files with names like "Copy of", "Untitled", or numbered duplicates
 5. **Keep**: Recent documents, important file types (.pdf, .docx, .xlsx) that are recent
 
+The file list is split into labeled batches (BATCH_1, BATCH_2, ...) separated by "---".
+Each batch is CSV with header: name,type,size_mb,modified,ext
+(type is "f" for a file or "d" for a folder, modified is YYYY-MM-DD, ext is empty when there is none).
+Analyze every batch and return exactly one entry per batch, using its label as the id.
+
 Return your response as a JSON object with this structure:
 {
-  "suggestions": [
+  "batches": [
     {
-      "filename": "example.dmg",
-      "reason": "Old installer file, likely no longer needed",
-      "confidence": "high",
-      "size_mb": 150.5,
-      "age_days": 180
+      "id": "BATCH_1",
+      "suggestions": [
+        {
+          "filename": "example.dmg",
+          "reason": "Old installer file, likely no longer needed",
+          "confidence": "high",
+          "size_mb": 150.5,
+          "age_days": 180
+        }
+      ]
     }
-  ],
-  "summary": {
-    "total_files_scanned": 50,
-    "files_suggested_for_deletion": 10,
-    "total_space_to_free_mb": 500.2,
-    "keep_recent_days": 30
-  }
+  ]
 }
 
 Be conservative - only suggest deletion if you're reasonably confident the file is safe to remove."""
 
-    user_prompt = f"""I have {file_count} items in my Downloads folder, totaling {total_size_mb:.2f} MB.
+
+def build_chat_request(batches: List[FileTable]) -> Dict[str, Any]:
+    """Build the chat completion request body used for both sync and batch calls.
+    
+    Each element of `batches` becomes one labeled query (BATCH_1, BATCH_2, ...)
+    in a single user message, sharing one system prompt."""
+    
+    file_count = sum(len(batch) for batch in batches)
+    total_size_mb = sum(batch.total_size_mb() for batch in batches)
+    file_list_text = "\n---\n".join(
+        f"BATCH_{i}:\n{format_files_for_prompt(batch)}"
+        for i, batch in enumerate(batches, start=1)
+    )
+    
+    user_prompt = f"""Here are {file_count} items from my Downloads folder, totaling {total_size_mb:.2f} MB, split into {len(batches)} batches.
 
 Here's the list of files and folders:
 
@@ -122,28 +306,366 @@ Here's the list of files and folders:
 
 Please analyze these files and suggest which ones can be safely deleted. Return your response as valid JSON only."""
 
+    return {
+        "model": "gpt-4o-mini",
+        "messages": [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": user_prompt}
+        ],
+        "response_format": {"type": "json_object"},
+        "temperature": 0,  # Deterministic suggestions, so identical file lists can be served from cache
+        "seed": 42,
+        "user": PROMPT_CACHE_USER
+    }
+
+
+def build_chat_requests(files: FileTable) -> List[Dict[str, Any]]:
+    """Split the file list into labeled batches and group them into as few requests as possible."""
+    order = files.prompt_order()
+    batches = [
+        files[order[start:start + FILES_PER_BATCH]]
+        for start in range(0, len(order), FILES_PER_BATCH)
+    ]
+    return [
+        build_chat_request(group)
+        for group in chunk_files(batches, MAX_BATCHES_PER_REQUEST)
+    ]
+
+
+def parse_suggestions(content: str) -> Dict[str, Any]:
+    """Parse the JSON suggestions returned by the model."""
     try:
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            response_format={"type": "json_object"},
-            temperature=0.3  # Lower temperature for more consistent, conservative suggestions
-        )
-        
-        result = json.loads(response.choices[0].message.content)
-        return result
+        return json_loads(content)
     except json.JSONDecodeError as e:
         print(f"Error: Failed to parse JSON response: {e}")
-        print(f"Raw response: {response.choices[0].message.content}")
-        raise
-    except Exception as e:
-        print(f"Error calling OpenAI API: {e}")
+        print(f"Raw response: {content}")
         raise
 
 
+def merge_suggestions(results: List[Dict[str, Any]], total_files: int) -> Dict[str, Any]:
+    """Flatten per-batch responses into the structure expected by display_suggestions."""
+    suggestion_list = [
+        suggestion
+        for result in results
+        for batch in result.get("batches", [])
+        for suggestion in batch.get("suggestions", [])
+    ]
+    return {
+        "suggestions": suggestion_list,
+        "summary": {
+            "total_files_scanned": total_files,
+            "files_suggested_for_deletion": len(suggestion_list),
+            "total_space_to_free_mb": sum(s.get("size_mb", 0) for s in suggestion_list)
+        }
+    }
+
+
+def response_cache_path(request: Dict[str, Any]) -> Path:
+    """Return the cache file for a chat completion request."""
+    key = hashlib.sha256(json_dumps(request).encode()).hexdigest()
+    return RESPONSE_CACHE_DIR / f"{key}.json"
+
+
+def is_valid_response(result: Any) -> bool:
+    """Check that a parsed response has the per-batch structure the prompt asks for."""
+    return isinstance(result, dict) and isinstance(result.get("batches"), list)
+
+
+def load_cached_response(cache_path: Path) -> Optional[Dict[str, Any]]:
+    """Load a cached parsed response, if any, that is well-formed and not expired."""
+    try:
+        age_seconds = datetime.now().timestamp() - cache_path.stat().st_mtime
+    except OSError:
+        return None
+    
+    if age_seconds > RESPONSE_CACHE_MAX_AGE_HOURS * 3600:
+        try:
+            cache_path.unlink()
+        except OSError:
+            pass
+        return None
+    
+    try:
+        with open(cache_path, "r") as f:
+            result = json_loads(f.read())
+    except (json.JSONDecodeError, IOError):
+        return None
+    return result if is_valid_response(result) else None
+
+
+def prune_response_cache() -> None:
+    """Delete expired cache entries and the oldest ones beyond RESPONSE_CACHE_MAX_ENTRIES."""
+    entries = []
+    for path in RESPONSE_CACHE_DIR.glob("*.json"):
+        try:
+            entries.append((path.stat().st_mtime, path))
+        except OSError:
+            continue
+    
+    entries.sort(reverse=True)
+    cutoff = datetime.now().timestamp() - RESPONSE_CACHE_MAX_AGE_HOURS * 3600
+    for i, (mtime, path) in enumerate(entries):
+        if i >= RESPONSE_CACHE_MAX_ENTRIES or mtime < cutoff:
+            try:
+                path.unlink()
+            except OSError:
+                continue
+
+
+def save_cached_response(cache_path: Path, result: Dict[str, Any]) -> None:
+    """Cache a well-formed parsed response on disk."""
+    if not is_valid_response(result):
+        return
+    
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, "w") as f:
+            f.write(json_dumps(result))
+        prune_response_cache()
+    except OSError as e:
+        print(f"Warning: Could not cache response: {e}")
+
+
+def retry_after_seconds(error: RateLimitError, default: float) -> float:
+    """Read the retry-after header (seconds or HTTP-date), falling back to `default`
+    for missing or invalid values and capping it at MAX_RETRY_AFTER_SECONDS."""
+    value = error.response.headers.get("retry-after")
+    if not value:
+        return default
+    try:
+        seconds = float(value)
+    except ValueError:
+        pass
+    else:
+        # Reject nan/inf, which would make asyncio.sleep() misbehave or hang
+        return min(max(seconds, 0.0), MAX_RETRY_AFTER_SECONDS) if math.isfinite(seconds) else default
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER_SECONDS)
+
+
+def _preview_line(item: Any) -> Optional[str]:
+    """Format a streamed suggestion for the progress preview, tolerating malformed values.
+    Validation is left to the full parse; the preview must never fail a response."""
+    if not isinstance(item, dict):
+        return None
+    emoji = _EMOJI.get(str(item.get("confidence", "")).lower(), "⚪")
+    size = item.get("size_mb", 0)
+    size_text = f"{size:.2f} MB" if isinstance(size, (int, float)) else str(size)
+    return f"   … {emoji} {item.get('filename', '?')} ({size_text})"
+
+
+async def read_streamed_response(stream: Any) -> Tuple[str, Any]:
+    """Accumulate a streamed completion and return its content and usage.
+    When ijson is installed, each suggestion is printed as interim progress as soon as
+    it is complete; display_suggestions shows the full list afterwards."""
+    parts = []
+    usage = None
+    completed = None
+    parser = None
+    if ijson is not None:
+        completed = ijson.sendable_list()
+        parser = ijson.items_coro(completed, "batches.item.suggestions.item", use_float=True)
+    
+    async for chunk in stream:
+        if chunk.usage is not None:
+            usage = chunk.usage
+        if not chunk.choices or not chunk.choices[0].delta.content:
+            continue
+        
+        delta = chunk.choices[0].delta.content
+        parts.append(delta)
+        if parser is None:
+            continue
+        try:
+            parser.send(delta.encode())
+        except ijson.JSONError:
+            # Leave error reporting to the buffered parse of the full content
+            parser = None
+            continue
+        for item in completed:
+            line = _preview_line(item)
+            if line is not None:
+                print(line)
+        del completed[:]
+    
+    return "".join(parts), usage
+
+
+async def request_suggestions(request: Dict[str, Any], client: AsyncOpenAI,
+                              semaphore: asyncio.Semaphore) -> Dict[str, Any]:
+    """Send one chat completion request, backing off when rate limited.
+    Responses for a previously seen request are served from the disk cache."""
+    cache_path = response_cache_path(request)
+    cached = load_cached_response(cache_path)
+    if cached is not None:
+        print("📦 Reusing cached suggestions for an unchanged file list")
+        return cached
+    
+    # This loop does its own backoff, so the SDK must not retry on top of it
+    chat_client = client.with_options(max_retries=0)
+    async with semaphore:
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            try:
+                stream = await chat_client.chat.completions.create(
+                    **request,
+                    stream=True,
+                    stream_options={"include_usage": True}
+                )
+                break
+            except (RateLimitError, APIConnectionError, InternalServerError) as e:
+                if attempt == MAX_RATE_LIMIT_RETRIES:
+                    print(f"Error calling OpenAI API: {e}")
+                    raise
+                if isinstance(e, RateLimitError):
+                    delay = retry_after_seconds(e, default=2 ** attempt)
+                    print(f"⏳ Rate limited, retrying in {delay:.1f}s...")
+                else:
+                    delay = 2 ** attempt
+                    print(f"⏳ Temporary API error, retrying in {delay:.1f}s...")
+                await asyncio.sleep(delay)
+            except Exception as e:
+                print(f"Error calling OpenAI API: {e}")
+                raise
+        
+        try:
+            content, usage = await read_streamed_response(stream)
+        except Exception as e:
+            print(f"Error calling OpenAI API: {e}")
+            raise
+    
+    details = getattr(usage, "prompt_tokens_details", None)
+    cached_tokens = getattr(details, "cached_tokens", 0) or 0
+    if cached_tokens:
+        print(f"♻️  {cached_tokens} prompt tokens served from cache")
+    
+    result = parse_suggestions(content)
+    save_cached_response(cache_path, result)
+    return result
+
+
+async def get_deletion_suggestions(files: FileTable, client: AsyncOpenAI) -> Dict[str, Any]:
+    """Get deletion suggestions from GPT-4o-mini, sending requests concurrently."""
+    requests = build_chat_requests(files)
+    if ijson is not None and not all(response_cache_path(request).exists() for request in requests):
+        print("📡 Receiving suggestions (preview; the full list is shown once all responses arrive)...")
+    
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    results = await asyncio.gather(*(
+        request_suggestions(request, client, semaphore)
+        for request in requests
+    ))
+    
+    return merge_suggestions(list(results), len(files))
+
+
+def load_pending_batch() -> Optional[Dict[str, Any]]:
+    """Load the pending Batch API job state, if any."""
+    if not BATCH_STATE_FILE.exists():
+        return None
+    
+    try:
+        with open(BATCH_STATE_FILE, "r") as f:
+            return json_loads(f.read())
+    except (json.JSONDecodeError, IOError) as e:
+        print(f"Warning: Could not load pending batch state: {e}")
+        return None
+
+
+def save_pending_batch(batch_id: str, file_count: int, auto_kept_count: int,
+                       signature: List[Any]) -> None:
+    """Persist the id of a submitted Batch API job."""
+    state = {
+        "batch_id": batch_id,
+        "file_count": file_count,
+        "auto_kept_count": auto_kept_count,
+        "signature": signature,
+        "submitted_date": datetime.now().isoformat()
+    }
+    with open(BATCH_STATE_FILE, "w") as f:
+        f.write(json_dumps(state, indent=True))
+
+
+def clear_pending_batch() -> None:
+    """Forget the pending Batch API job."""
+    if BATCH_STATE_FILE.exists():
+        BATCH_STATE_FILE.unlink()
+
+
+async def submit_batch_job(files: FileTable, client: AsyncOpenAI, auto_kept_count: int) -> str:
+    """Submit the suggestion request to the Batch API and return the batch id."""
+    timestamp = datetime.now().strftime('%Y%m%d%H%M%S')
+    
+    with tempfile.NamedTemporaryFile("w", suffix=".jsonl", delete=False) as tmp:
+        for i, request in enumerate(build_chat_requests(files), start=1):
+            request_line = {
+                "custom_id": f"cleanup-{timestamp}-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": request
+            }
+            tmp.write(json_dumps(request_line) + "\n")
+        input_path = Path(tmp.name)
+    
+    try:
+        with open(input_path, "rb") as f:
+            input_file = await client.files.create(file=f, purpose="batch")
+    finally:
+        input_path.unlink()
+    
+    batch = await client.batches.create(
+        input_file_id=input_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h"
+    )
+    save_pending_batch(batch.id, len(files), auto_kept_count, scan_signature(files))
+    return batch.id
+
+
+async def read_batch_file(file_id: str, client: AsyncOpenAI) -> List[Dict[str, Any]]:
+    """Download a Batch API output or error file and parse its JSONL records."""
+    content = await client.files.content(file_id)
+    return [json_loads(line) for line in content.text.splitlines() if line.strip()]
+
+
+async def fetch_batch_suggestions(batch: Any, client: AsyncOpenAI, total_files: int) -> Dict[str, Any]:
+    """Download the output of a finished batch and merge the suggestions.
+    Failed requests are reported; RuntimeError is raised if no request succeeded."""
+    results = []
+    failed_ids = []
+    
+    if batch.output_file_id:
+        for record in await read_batch_file(batch.output_file_id, client):
+            response = record.get("response") or {}
+            if record.get("error") or response.get("status_code") != 200:
+                failed_ids.append(record.get("custom_id"))
+                continue
+            try:
+                results.append(parse_suggestions(response["body"]["choices"][0]["message"]["content"]))
+            except (json.JSONDecodeError, KeyError, IndexError, TypeError):
+                failed_ids.append(record.get("custom_id"))
+    
+    # Requests that failed outright are listed in the error file, not the output file
+    if batch.error_file_id:
+        failed_ids.extend(record.get("custom_id") for record in await read_batch_file(batch.error_file_id, client))
+    
+    counts = getattr(batch, "request_counts", None)
+    failed_count = max(len(failed_ids), getattr(counts, "failed", 0) or 0)
+    if failed_count:
+        print(f"⚠️  {failed_count} batch request(s) failed; files in them got no suggestions:")
+        for custom_id in failed_ids:
+            print(f"   • {custom_id}")
+    
+    if not results:
+        raise RuntimeError(f"Batch {batch.id} produced no usable output")
+    return merge_suggestions(results, total_files)
+
+
 def display_suggestions(suggestions: Dict[str, Any]):
     """Display the deletion suggestions in a user-friendly format."""
     print("\n" + "="*70)
@@ -153,6 +675,8 @@ def display_suggestions(suggestions: Dict[str, Any]):
     summary = suggestions.get("summary", {})
     print(f"\n📊 Summary:")
     print(f"   • Total files scanned: {summary.get('total_files_scanned', 0)}")
+    if summary.get("files_auto_kept"):
+        print(f"   • Skipped as obvious keeps: {summary['files_auto_kept']}")
     print(f"   • Files suggested for deletion: {summary.get('files_suggested_for_deletion', 0)}")
     print(f"   • Space to free: {summary.get('total_space_to_free_mb', 0):.2f} MB")
     
@@ -163,80 +687,73 @@ def display_suggestions(suggestions: Dict[str, Any]):
     
     print(f"\n🗑️  Suggested for deletion ({len(suggestion_list)} files):\n")
     
-    # Group by confidence level
-    high_conf = [s for s in suggestion_list if s.get("confidence", "").lower() == "high"]
-    medium_conf = [s for s in suggestion_list if s.get("confidence", "").lower() == "medium"]
-    low_conf = [s for s in suggestion_list if s.get("confidence", "").lower() == "low"]
-    
-    if high_conf:
-        print("🔴 HIGH CONFIDENCE:")
-        for item in high_conf:
-            print(f"   • {item['filename']}")
-            print(f"     Reason: {item.get('reason', 'N/A')}")
-            print(f"     Size: {item.get('size_mb', 0):.2f} MB")
-            if 'age_days' in item:
-                print(f"     Age: {item['age_days']} days")
-            print()
-    
-    if medium_conf:
-        print("🟡 MEDIUM CONFIDENCE:")
-        for item in medium_conf:
-            print(f"   • {item['filename']}")
-            print(f"     Reason: {item.get('reason', 'N/A')}")
-            print(f"     Size: {item.get('size_mb', 0):.2f} MB")
-            if 'age_days' in item:
-                print(f"     Age: {item['age_days']} days")
-            print()
-    
-    if low_conf:
-        print("🟢 LOW CONFIDENCE (review carefully):")
-        for item in low_conf:
-            print(f"   • {item['filename']}")
-            print(f"     Reason: {item.get('reason', 'N/A')}")
-            print(f"     Size: {item.get('size_mb', 0):.2f} MB")
+    # Group by confidence level in a single pass
+    buckets = {"high": [], "medium": [], "low": []}
+    for s in suggestion_list:
+        buckets.setdefault(s.get("confidence", "").lower(), []).append(s)
+    high_conf, medium_conf, low_conf = buckets["high"], buckets["medium"], buckets["low"]
+    
+    for header, items in (
+        ("🔴 HIGH CONFIDENCE:", high_conf),
+        ("🟡 MEDIUM CONFIDENCE:", medium_conf),
+        ("🟢 LOW CONFIDENCE (review carefully):", low_conf),
+    ):
+        if not items:
+            continue
+        # Build the whole section first so it goes out in a single write
+        out = [header]
+        for item in items:
+            out.append(f"   • {item['filename']}")
+            out.append(f"     Reason: {item.get('reason', 'N/A')}")
+            out.append(f"     Size: {item.get('size_mb', 0):.2f} MB")
             if 'age_days' in item:
-                print(f"     Age: {item['age_days']} days")
-            print()
+                out.append(f"     Age: {item['age_days']} days")
+            out.append("")
+        sys.stdout.write("\n".join(out) + "\n")
     
     print("="*70)
     print("⚠️  Please review these suggestions carefully before deleting any files!")
     print("="*70)
 
 
-def mark_files_as_keep(suggestions: Dict[str, Any], downloads_path: Path) -> List[str]:
+def _short(reason: str) -> str:
+    """Truncate a reason so a checkbox label fits on one line."""
+    if len(reason) <= 60:
+        return reason
+    shortened = textwrap.shorten(reason, width=60, placeholder="...")
+    if shortened == "...":
+        # shorten() drops a leading word that doesn't fit; cut mid-word instead
+        return reason[:57] + "..."
+    return shortened
+
+
+def _build_choices(suggestion_list: List[Dict[str, Any]]) -> List[questionary.Choice]:
+    """Create checkbox options with file details for each suggestion."""
+    return [
+        questionary.Choice(
+            title=(
+                f"{_EMOJI.get(item.get('confidence', '').lower(), '⚪')} {item['filename']} "
+                f"({item.get('size_mb', 0):.2f} MB) - {_short(item.get('reason', 'N/A'))}"
+            ),
+            value=item['filename']
+        )
+        for item in suggestion_list
+    ]
+
+
+async def mark_files_as_keep(suggestions: Dict[str, Any], downloads_path: Path) -> List[str]:
     """Allow user to mark files as 'keep' so they won't be suggested again."""
     suggestion_list = suggestions.get("suggestions", [])
     if not suggestion_list:
         return []
     
-    # Create checkbox options with file details
-    choices = []
-    for item in suggestion_list:
-        confidence_emoji = {
-            "high": "🔴",
-            "medium": "🟡", 
-            "low": "🟢"
-        }.get(item.get("confidence", "").lower(), "⚪")
-        
-        # Truncate reason if too long
-        reason = item.get('reason', 'N/A')
-        if len(reason) > 60:
-            reason = reason[:57] + "..."
-        
-        label = (
-            f"{confidence_emoji} {item['filename']} "
-            f"({item.get('size_mb', 0):.2f} MB) - {reason}"
-        )
-        choices.append(questionary.Choice(
-            title=label,
-            value=item['filename']
-        ))
+    choices = _build_choices(suggestion_list)
     
-    selected = questionary.checkbox(
+    selected = await questionary.checkbox(
         "Mark files as 'keep' (they won't be suggested again):",
         choices=choices,
         instruction="(Press <space> to select, <↑↓> to navigate, <enter> to confirm, or <esc> to skip)"
-    ).ask()
+    ).ask_async()
     
     return selected or []
 
@@ -251,62 +768,36 @@ def open_file_with_default_app(file_path: Path) -> None:
         print(f"Error opening file: {e}")
 
 
-def interactive_file_selection(suggestions: Dict[str, Any], downloads_path: Path) -> List[str]:
+async def interactive_file_selection(suggestions: Dict[str, Any], downloads_path: Path) -> List[str]:
     """Display suggestions with checkboxes and return selected filenames.
     After selection, users can open files before confirming deletion."""
     suggestion_list = suggestions.get("suggestions", [])
     if not suggestion_list:
         return []
     
-    # Create checkbox options with file details
-    choices = []
-    file_paths = {}  # Map filename to full path for opening
-    
-    for item in suggestion_list:
-        confidence_emoji = {
-            "high": "🔴",
-            "medium": "🟡", 
-            "low": "🟢"
-        }.get(item.get("confidence", "").lower(), "⚪")
-        
-        # Truncate reason if too long
-        reason = item.get('reason', 'N/A')
-        if len(reason) > 60:
-            reason = reason[:57] + "..."
-        
-        filename = item['filename']
-        file_path = downloads_path / filename
-        file_paths[filename] = file_path
-        
-        label = (
-            f"{confidence_emoji} {filename} "
-            f"({item.get('size_mb', 0):.2f} MB) - {reason}"
-        )
-        choices.append(questionary.Choice(
-            title=label,
-            value=filename
-        ))
+    choices = _build_choices(suggestion_list)
+    file_paths = {item['filename']: downloads_path / item['filename'] for item in suggestion_list}
     
     while True:
-        selected = questionary.checkbox(
+        selected = await questionary.checkbox(
             "Select files to delete (use space to toggle, enter to confirm):",
             choices=choices,
             instruction="(Press <space> to select, <↑↓> to navigate, <enter> to confirm)"
-        ).ask()
+        ).ask_async()
         
         if not selected:
             return []
         
         # Offer to open selected files
         print("\n" + "="*70)
-        open_choice = questionary.select(
+        open_choice = await questionary.select(
             f"You've selected {len(selected)} file(s). What would you like to do?",
             choices=[
                 questionary.Choice("✅ Confirm selection and proceed", value="confirm"),
                 questionary.Choice("📂 Open selected files to review", value="open"),
                 questionary.Choice("↩️  Go back and modify selection", value="back")
             ]
-        ).ask()
+        ).ask_async()
         
         if open_choice == "confirm":
             return selected
@@ -329,56 +820,101 @@ def interactive_file_selection(suggestions: Dict[str, Any], downloads_path: Path
     return selected or []
 
 
-def load_kept_files() -> set:
-    """Load kept files from JSON database and return a set of filenames."""
-    if not KEPT_FILES_DB.exists():
-        return set()
-    
-    try:
-        with open(KEPT_FILES_DB, "r") as f:
-            data = json.load(f)
-            kept_filenames = {item["filename"] for item in data.get("kept_files", [])}
-            return kept_filenames
-    except (json.JSONDecodeError, KeyError, IOError) as e:
-        print(f"Warning: Could not load kept files database: {e}")
-        return set()
+def iter_kept_log() -> Iterator[str]:
+    """Yield filenames from the append-only kept files log."""
+    with open(KEPT_FILES_DB, "r") as f:
+        for line in f:
+            try:
+                yield json_loads(line)["filename"]
+            except (json.JSONDecodeError, KeyError):
+                # Skip a partially written line left by an interrupted session
+                continue
 
 
-def save_kept_file(filename: str) -> None:
-    """Add a file to the kept files database."""
-    # Load existing data
-    if KEPT_FILES_DB.exists():
+def load_kept_files() -> set:
+    """Load kept files from the kept files database and return a set of filenames."""
+    kept_filenames = set()
+    
+    # Entries saved before the switch to the append-only log
+    if LEGACY_KEPT_FILES_DB.exists():
         try:
-            with open(KEPT_FILES_DB, "r") as f:
-                data = json.load(f)
-        except (json.JSONDecodeError, IOError):
-            data = {"kept_files": [], "metadata": {}}
-    else:
-        data = {"kept_files": [], "metadata": {}}
-    
-    # Check if file is already in the list
-    existing_filenames = {item["filename"] for item in data.get("kept_files", [])}
-    if filename not in existing_filenames:
-        # Add new entry
-        kept_entry = {
-            "filename": filename,
-            "marked_date": datetime.now().isoformat(),
-            "reason": "User explicitly marked as keep"
-        }
-        data["kept_files"].append(kept_entry)
-        data["metadata"]["last_updated"] = datetime.now().isoformat()
-        
-        # Save back to file
+            with open(LEGACY_KEPT_FILES_DB, "r") as f:
+                data = json_loads(f.read())
+                kept_filenames = set(map(itemgetter("filename"), data.get("kept_files", [])))
+        except (json.JSONDecodeError, KeyError, IOError) as e:
+            print(f"Warning: Could not load legacy kept files database: {e}")
+    
+    if KEPT_FILES_DB.exists():
         try:
-            with open(KEPT_FILES_DB, "w") as f:
-                json.dump(data, f, indent=2)
+            kept_filenames.update(iter_kept_log())
         except IOError as e:
-            print(f"Warning: Could not save kept file entry: {e}")
+            print(f"Warning: Could not load kept files database: {e}")
+    
+    return kept_filenames
+
+
+def save_kept_file(filename: str) -> None:
+    """Append a file to the kept files database."""
+    kept_entry = {
+        "filename": filename,
+        "marked_date": datetime.now().isoformat(),
+        "reason": "User explicitly marked as keep"
+    }
+    
+    line = (json_dumps(kept_entry) + "\n").encode()
+    
+    try:
+        with open(KEPT_FILES_DB, "ab+") as f:
+            # Serialize appends from concurrent sessions
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                # Don't glue the entry onto a partial line left by an interrupted write
+                end = f.seek(0, os.SEEK_END)
+                if end:
+                    f.seek(end - 1)
+                    if f.read(1) != b"\n":
+                        line = b"\n" + line
+                f.write(line)
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+    except IOError as e:
+        print(f"Warning: Could not save kept file entry: {e}")
 
 
-def filter_kept_files(files: List[Dict[str, Any]], kept_filenames: set) -> List[Dict[str, Any]]:
+def filter_kept_files(files: FileTable, kept_filenames: set) -> FileTable:
     """Remove kept files from the file list before AI analysis."""
-    return [f for f in files if f["name"] not in kept_filenames]
+    mask = np.array([name not in kept_filenames for name in files.names], dtype=bool)
+    return files[mask]
+
+
+def pre_filter_obvious_keeps(files: FileTable) -> Tuple[FileTable, FileTable]:
+    """Split files into AI candidates and recent, small documents that are always kept."""
+    try:
+        cutoff_ns = int((datetime.now() - timedelta(days=AUTO_KEEP_MAX_AGE_DAYS)).timestamp() * 1e9)
+    except (OverflowError, OSError, ValueError):
+        # An age window reaching past the representable dates means no cutoff
+        cutoff_ns = np.iinfo(np.int64).min
+    keep = (
+        ~files.is_dir
+        & np.isin(files.extensions, list(SAFE_EXTENSIONS))
+        & (files.sizes < AUTO_KEEP_MAX_SIZE_MB * 1024 * 1024)
+        & (files.mtimes >= cutoff_ns)
+    )
+    return files[~keep], files[keep]
+
+
+def _unlink_one(base: str, filename: str) -> Tuple[bool, str, Any]:
+    """Delete one file. Returns (True, filename, size_mb) or (False, filename, error)."""
+    file_path = base + filename
+    try:
+        # stat() both confirms the file exists and captures its size
+        size_mb = os.stat(file_path).st_size / (1024 * 1024)
+        os.unlink(file_path)  # Delete the file
+        return True, filename, size_mb
+    except FileNotFoundError:
+        return False, filename, "not found"
+    except OSError as e:
+        return False, filename, f"error: {str(e)}"
 
 
 def delete_selected_files(selected_filenames: List[str], downloads_path: Path) -> Dict[str, Any]:
@@ -386,19 +922,18 @@ def delete_selected_files(selected_filenames: List[str], downloads_path: Path) -
     deleted = []
     failed = []
     total_freed_mb = 0.0
+    base = os.fspath(downloads_path) + os.sep
     
-    for filename in selected_filenames:
-        file_path = downloads_path / filename
-        try:
-            if file_path.exists():
-                size_mb = file_path.stat().st_size / (1024 * 1024)
-                file_path.unlink()  # Delete the file
+    # unlink() releases the GIL, so threads overlap slow metadata calls on
+    # network or cloud-synced folders
+    with ThreadPoolExecutor(max_workers=MAX_DELETE_WORKERS) as executor:
+        results = executor.map(lambda filename: _unlink_one(base, filename), selected_filenames)
+        for ok, filename, detail in results:
+            if ok:
                 deleted.append(filename)
-                total_freed_mb += size_mb
+                total_freed_mb += detail
             else:
-                failed.append(f"{filename} (not found)")
-        except Exception as e:
-            failed.append(f"{filename} (error: {str(e)})")
+                failed.append(f"{filename} ({detail})")
     
     return {
         "deleted": deleted,
@@ -408,52 +943,116 @@ def delete_selected_files(selected_filenames: List[str], downloads_path: Path) -
     }
 
 
-def run_cleanup_session(client: OpenAI) -> None:
-    """Run a single cleanup session."""
+def scan_signature(files: FileTable) -> List[Any]:
+    """Summarize the analyzed files as (count, total size, XOR of mtimes, hash of names).
+    The names hash catches renames, which keep size and mtime.
+    The saved suggestions file is ignored, since every run rewrites it."""
+    files = files[np.array([name != SUGGESTIONS_FILENAME for name in files.names], dtype=bool)]
+    names_digest = hashlib.sha256("\n".join(sorted(files.names)).encode()).hexdigest()
+    return [
+        len(files),
+        int(files.sizes.sum()),
+        int(np.bitwise_xor.reduce(files.mtimes)) if len(files) else 0,
+        names_digest,
+    ]
+
+
+def save_suggestions(suggestions: Dict[str, Any], downloads_path: Path,
+                     signature: Optional[List[Any]], analyzed_date: str) -> Path:
+    """Save suggestions to the Downloads folder together with the signature of the
+    files they were made for, so a later run can tell whether they still apply."""
+    # Drop the old signature first so it can never describe the new suggestions file
+    if SCAN_SIGNATURE_FILE.exists():
+        SCAN_SIGNATURE_FILE.unlink()
+    
+    output_file = downloads_path / SUGGESTIONS_FILENAME
+    with open(output_file, "w") as f:
+        f.write(json_dumps(suggestions, indent=True))
+    
+    if signature is not None:
+        try:
+            with open(SCAN_SIGNATURE_FILE, "w") as f:
+                f.write(json_dumps({"signature": signature, "analyzed_date": analyzed_date}))
+        except IOError as e:
+            print(f"Warning: Could not save scan signature: {e}")
+    
+    return output_file
+
+
+def load_reusable_suggestions(downloads_path: Path, signature: List[Any]) -> Optional[Dict[str, Any]]:
+    """Return the saved suggestions if they are recent and the analyzed files haven't changed."""
+    output_file = downloads_path / SUGGESTIONS_FILENAME
+    if not SCAN_SIGNATURE_FILE.exists() or not output_file.exists():
+        return None
+    
+    try:
+        with open(SCAN_SIGNATURE_FILE, "r") as f:
+            saved = json_loads(f.read())
+        if saved.get("signature") != signature:
+            return None
+        
+        # Age is measured from the analysis itself, not from when the file was last written
+        analyzed_date = datetime.fromisoformat(saved["analyzed_date"])
+        if datetime.now() - analyzed_date > timedelta(hours=SUGGESTIONS_MAX_AGE_HOURS):
+            return None
+        
+        with open(output_file, "r") as f:
+            return json_loads(f.read())
+    except (json.JSONDecodeError, AttributeError, KeyError, TypeError, ValueError, IOError):
+        return None
+
+
+def collect_files_for_analysis(downloads_path: Path) -> Tuple[FileTable, int]:
+    """Scan the Downloads folder and drop files that don't need AI analysis.
+    Returns the files to analyze and the number of obvious keeps skipped."""
     print("🔍 Scanning Downloads folder...")
-    downloads_path = get_downloads_folder()
     files = scan_downloads_folder(downloads_path)
     
     if not files:
         print("No files found in Downloads folder.")
-        return
+        return files, 0
     
     print(f"✅ Found {len(files)} items in Downloads folder")
     print(f"📁 Location: {downloads_path}")
-    print(f"💾 Total size: {sum(f['size_mb'] for f in files):.2f} MB")
     
-    # Load kept files and filter them out
+    # Load kept files and filter them out before computing totals
     kept_filenames = load_kept_files()
     if kept_filenames:
-        print(f"📌 Filtering out {len(kept_filenames)} file(s) marked as 'keep'")
+        scanned_count = len(files)
         files = filter_kept_files(files, kept_filenames)
-        print(f"📊 {len(files)} file(s) remaining for analysis\n")
-    else:
-        print()
+        print(f"📌 Filtering out {scanned_count - len(files)} file(s) marked as 'keep'")
     
-    print("🤖 Analyzing files with GPT-4o-mini...")
-    suggestions = get_deletion_suggestions(files, client)
+    files, auto_kept = pre_filter_obvious_keeps(files)
+    if auto_kept:
+        print(f"🛡️  Skipping {len(auto_kept)} recent, small document(s)")
     
+    print(f"📊 {len(files)} file(s) remaining for analysis")
+    print(f"💾 Total size: {files.total_size_mb():.2f} MB\n")
+    
+    return files, len(auto_kept)
+
+
+async def review_suggestions(suggestions: Dict[str, Any], downloads_path: Path,
+                             output_file: Optional[Path] = None) -> None:
+    """Display suggestions and let the user delete or keep the suggested files.
+    `output_file` is where freshly made suggestions were saved, if any."""
     display_suggestions(suggestions)
     
-    # Optionally save suggestions to a file
-    output_file = downloads_path / "cleanup_suggestions.json"
-    with open(output_file, "w") as f:
-        json.dump(suggestions, f, indent=2)
-    print(f"\n💾 Suggestions saved to: {output_file}")
+    if output_file is not None:
+        print(f"\n💾 Suggestions saved to: {output_file}")
     
     # Interactive file selection
     suggestion_list = suggestions.get("suggestions", [])
     if suggestion_list:
         print("\n" + "="*70)
-        selected_files = interactive_file_selection(suggestions, downloads_path)
+        selected_files = await interactive_file_selection(suggestions, downloads_path)
         
         if selected_files:
             # Confirm deletion
-            confirm = questionary.confirm(
+            confirm = await questionary.confirm(
                 f"Are you sure you want to delete {len(selected_files)} file(s)? This cannot be undone!",
                 default=False
-            ).ask()
+            ).ask_async()
             
             if confirm:
                 result = delete_selected_files(selected_files, downloads_path)
@@ -474,42 +1073,107 @@ def run_cleanup_session(client: OpenAI) -> None:
             print("\nℹ️  No files selected for deletion.")
         
         # Ask if user wants to mark any files as "keep"
-        keep_files = mark_files_as_keep(suggestions, downloads_path)
+        keep_files = await mark_files_as_keep(suggestions, downloads_path)
         if keep_files:
             for filename in keep_files:
                 save_kept_file(filename)
             print(f"\n✅ Marked {len(keep_files)} file(s) as keep. They won't be suggested in future runs.")
 
 
-def main():
-    """Main function to run the cleanup agent."""
-    # Check for API key
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
-        print("Error: OPENAI_API_KEY not found in environment variables.")
-        print("Please set it in your .env file or export it as an environment variable.")
+async def run_cleanup_session(client: AsyncOpenAI) -> None:
+    """Run a single cleanup session."""
+    downloads_path = get_downloads_folder()
+    files, auto_kept_count = collect_files_for_analysis(downloads_path)
+    if not files:
         return
     
-    # Initialize OpenAI client
-    client = OpenAI(api_key=api_key)
+    signature = scan_signature(files)
+    suggestions = load_reusable_suggestions(downloads_path, signature)
+    output_file = None
+    if suggestions is not None:
+        print("♻️  Nothing changed since the last run, reusing saved suggestions")
+    else:
+        print("🤖 Analyzing files with GPT-4o-mini...")
+        analyzed_date = datetime.now().isoformat()
+        suggestions = await get_deletion_suggestions(files, client)
+        suggestions["summary"]["files_auto_kept"] = auto_kept_count
+        output_file = save_suggestions(suggestions, downloads_path, signature, analyzed_date)
     
-    # Main loop
+    await review_suggestions(suggestions, downloads_path, output_file)
+
+
+async def run_batch_session(client: AsyncOpenAI) -> None:
+    """Submit a Batch API job, or collect the results of a previously submitted one."""
+    downloads_path = get_downloads_folder()
+    
+    pending = load_pending_batch()
+    if pending:
+        batch = await client.batches.retrieve(pending["batch_id"])
+        if batch.status in BATCH_PENDING_STATUSES:
+            print(f"⏳ Batch {batch.id} is still {batch.status} (submitted {pending['submitted_date'][:16]}).")
+            print("   Run again later to review the suggestions.")
+            return
+        
+        if batch.status not in BATCH_COLLECTABLE_STATUSES:
+            clear_pending_batch()
+            print(f"❌ Batch {batch.id} ended with status '{batch.status}'. Run again to resubmit.")
+            return
+        
+        if batch.status == "completed":
+            print(f"✅ Batch {batch.id} completed")
+        else:
+            print(f"⚠️  Batch {batch.id} {batch.status}; collecting any partial results")
+        
+        try:
+            suggestions = await fetch_batch_suggestions(batch, client, pending.get("file_count", 0))
+        except (APIConnectionError, InternalServerError, RateLimitError) as e:
+            # Transient: keep the batch id so the paid-for results can be collected later
+            print(f"Error: Could not download the results of batch {batch.id}: {e}")
+            print("   Run again with --batch to retry.")
+            return
+        except (APIStatusError, RuntimeError, ValueError) as e:
+            # Permanent: retrying would fail the same way, so allow a new submission
+            clear_pending_batch()
+            print(f"❌ Could not collect the results of batch {batch.id}: {e}")
+            print("   Run again with --batch to resubmit.")
+            return
+        clear_pending_batch()
+        suggestions["summary"]["files_auto_kept"] = pending.get("auto_kept_count", 0)
+        # The suggestions describe the folder as it was when the batch was submitted
+        output_file = save_suggestions(
+            suggestions, downloads_path, pending.get("signature"), pending["submitted_date"]
+        )
+        await review_suggestions(suggestions, downloads_path, output_file)
+        return
+    
+    files, auto_kept_count = collect_files_for_analysis(downloads_path)
+    if not files:
+        return
+    
+    print("📤 Submitting files to the OpenAI Batch API...")
+    batch_id = await submit_batch_job(files, client, auto_kept_count)
+    print(f"✅ Submitted batch {batch_id}. Results are usually ready within 24 hours.")
+    print("   Run again with --batch to review the suggestions.")
+
+
+async def run_agent(client: AsyncOpenAI) -> None:
+    """Run cleanup sessions until the user chooses to exit."""
     while True:
         try:
-            run_cleanup_session(client)
+            await run_cleanup_session(client)
         except Exception as e:
             print(f"Error: {e}")
             raise
         
         # Ask if user wants to run again
         print("\n" + "="*70)
-        run_again = questionary.select(
+        run_again = await questionary.select(
             "What would you like to do?",
             choices=[
                 questionary.Choice("Run cleanup again", value=True),
                 questionary.Choice("Exit", value=False)
             ]
-        ).ask()
+        ).ask_async()
         
         if not run_again:
             print("\n👋 Goodbye!")
@@ -517,6 +1181,31 @@ def main():
         print("\n" + "="*70 + "\n")
 
 
+def main():
+    """Main function to run the cleanup agent."""
+    parser = argparse.ArgumentParser(description="Suggest files in your Downloads folder that can be deleted.")
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Use the OpenAI Batch API (half price, results within 24h). Run again to collect results."
+    )
+    args = parser.parse_args()
+    
+    # Check for API key
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        print("Error: OPENAI_API_KEY not found in environment variables.")
+        print("Please set it in your .env file or export it as an environment variable.")
+        return
+    
+    # Initialize OpenAI client
+    client = AsyncOpenAI(api_key=api_key)
+    
+    if args.batch:
+        asyncio.run(run_batch_session(client))
+    else:
+        asyncio.run(run_agent(client))
+
+
 if __name__ == "__main__":
     main()
-